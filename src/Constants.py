@@ -5,6 +5,7 @@ Commonly used physical constants
 """
 
 import numpy as np
+import scipy.constants as sc
 
 # Tritium half life in years
 HALFLIFETRITIUM = 12.32  # years
@@ -20,3 +21,15 @@ RYDBERGEV = 13.605693122994  # eV
 
 # Hydrogen ionization energy in eV
 IONIZATIONENERGYH = 13.59844  # eV
+
+# Bohr radius in m, looked up from scipy once at import
+BOHRRADIUS = sc.physical_constants["Bohr radius"][0]  # m
+
+# Bohr cross-section, 4 pi a0^2
+BOHRXSEC = 4.0 * np.pi * BOHRRADIUS**2  # m^2
+
+# hbar c in eV m
+HBARCEV = sc.hbar * sc.c / sc.e  # eV m
+
+# Tritium nuclear mass in kg
+TRITIUMMASS = 3.01604928 * sc.m_u  # kg
@@ -0,0 +1,91 @@
+"""
+    CrossSectionTable.py
+
+    Struct-of-arrays container for Kim & Rudd (1994) ionization
+    cross-sections evaluated over a grid of primary energies. Instead of one
+    Python object per energy, all intermediate quantities (t, log t, the
+    dipole term D, the total cross-section) are stored as parallel
+    contiguous arrays computed once, so queries are indexed lookups or
+    vector kernels.
+"""
+
+import numpy as np
+
+import src.Constants as myconst
+from src.Kim1994 import _GetSpeciesParams
+
+
+class CrossSectionTable:
+    def __init__(self, Ts, species: str):
+        """
+        Constructor for the CrossSectionTable class. Precomputes every
+        T-dependent quantity for the whole energy grid.
+
+        Parameters
+        ----------
+        Ts : np.ndarray
+            Incident electron KEs in eV
+        species : str
+            Species for which the cross-sections are calculated
+        """
+        params = _GetSpeciesParams(species)
+        self.species = species
+        self.B = params["B"]
+        self.U = params["U"]
+        self.N = params["N"]
+        self.Ni = params["Ni"]
+        self.coeffs = params["coeffs"]
+        self.coeffsDesc = params["coeffsDesc"]
+
+        self.T = np.ascontiguousarray(Ts, dtype=np.float64)
+        self.t = self.T / self.B
+        self.logt = np.log(self.t)
+        self.u = self.U / self.B
+        self.S = myconst.BOHRXSEC * self.N * (myconst.RYDBERGEV / self.B)**2
+
+        tTerm = (self.t + 1.0) / 2.0
+        self.D = sum(self.coeffs[k - 1] / k * (1 - tTerm**-k)
+                     for k in range(2, 7)) / self.N
+
+        self.total = self.S / (self.t + self.u + 1) * \
+            (self.D * self.logt + (2 - self.Ni / self.N) *
+             ((self.t - 1) / self.t - self.logt / (self.t + 1)))
+
+    def TotalXSec(self) -> np.ndarray:
+        """
+        Total ionization cross-sections for the whole energy grid,
+        precomputed in the constructor.
+
+        Returns
+        -------
+        np.ndarray
+            Total cross-sections in m^2
+        """
+        return self.total
+
+    def SingleDiffXSec_W(self, W) -> np.ndarray:
+        """
+        Calculate the SDCS for every energy on the grid, broadcast against
+        the outgoing energies.
+
+        Parameters
+        ----------
+        W : float or np.ndarray
+            Outgoing electron energy in eV
+
+        Returns
+        -------
+        np.ndarray
+            SDCS in m^2/eV, of shape (nT,) for scalar W or (nT, nW) for
+            array W
+        """
+        W = np.asarray(W, dtype=np.float64)
+        t = self.t if W.ndim == 0 else self.t[:, None]
+        logt = self.logt if W.ndim == 0 else self.logt[:, None]
+        w = W / self.B
+        z = 1 / (w + 1)
+        prefac = self.S / (self.B * (t + self.u + 1))
+        term1 = (self.Ni / self.N - 2) / (t + 1) * (z + 1 / (t - w))
+        term2 = (2 - self.Ni / self.N) * (z**2 + 1 / (t - w)**2)
+        term3 = logt / (self.N * (w + 1)) * np.polyval(self.coeffsDesc, z)
+        return prefac * (term1 + term2 + term3)
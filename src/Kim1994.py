@@ -1,22 +1,184 @@
 """
     Kim1994.py
 
-    Class containing cross-sections from Kim & Rudd (1994) for electron-impact 
+    Class containing cross-sections from Kim & Rudd (1994) for electron-impact
     ionization of atoms and molecules
 """
 
+import math
+
 import numpy as np
-import scipy.constants as sc
+
+import src.Constants as myconst
+
+# Numba is optional: when present the SDCS over an array of outgoing
+# energies is evaluated by a compiled parallel kernel, otherwise the
+# vectorized NumPy path is used.
+try:
+    from numba import njit, prange
+    _HAVENUMBA = True
+except ImportError:
+    _HAVENUMBA = False
+
+# When Numba is unavailable, fall back to the ahead-of-time Cython kernels
+# in _kim_kernels.pyx, compiled on demand via pyximport. If Cython is
+# missing too, the vectorized NumPy path remains.
+_kimKernels = None
+if not _HAVENUMBA:
+    try:
+        import pyximport
+        pyximport.install(setup_args={"include_dirs": np.get_include()})
+        import src._kim_kernels as _kimKernels
+    except ImportError:
+        _kimKernels = None
+
+# Per-species parameters: binding energy B (eV), average orbital kinetic
+# energy U (eV), number of bound electrons N, integrated oscillator strength
+# Ni, and the oscillator-strength fit coefficients (a, b, c, d, e, f).
+# Built once at import so the cross-section methods do not rebuild them on
+# every call.
+_SPECIES = {
+    "H": {
+        "B": 1.36057e1,
+        "U": 1.36057e1,
+        "N": 1.0,
+        "Ni": 0.4343,
+        "coeffs": np.array([0.0, -2.2473e-2, 1.1775, -4.6264e-1, 8.9064e-2,
+                            0.0]),
+    },
+    "He": {
+        "B": 2.459e1,
+        "U": 3.951e1,
+        "N": 2.0,
+        "Ni": 1.605,
+        "coeffs": np.array([0.0, 0.0, 1.2178e1, -2.9585e1, 3.1251e1,
+                            -1.2175e1]),
+    },
+    "H2": {
+        "B": 1.543e1,
+        "U": 2.568e1,
+        "N": 2.0,
+        "Ni": 1.173,
+        "coeffs": np.array([0.0, 0.0, 1.1262, 6.3982, -7.8055, 2.1440]),
+    },
+}
+
+# Descending-order coefficients (with the zero constant term appended) for
+# Horner evaluation via np.polyval, precomputed once per species.
+for _params in _SPECIES.values():
+    _params["coeffs"] = np.ascontiguousarray(_params["coeffs"],
+                                             dtype=np.float64)
+    _params["coeffsDesc"] = np.concatenate((_params["coeffs"][::-1], [0.0]))
+del _params
+
+
+def _GetSpeciesParams(species: str) -> dict:
+    """
+    Fetch the parameter set for a species, raising for unsupported ones.
+    Single validation point for every entry into the Kim & Rudd model.
+
+    Parameters
+    ----------
+    species : str
+        Species for which the cross-sections are calculated
+
+    Returns
+    -------
+    dict
+        Species parameters from _SPECIES
+    """
+    try:
+        return _SPECIES[species]
+    except KeyError:
+        raise ValueError("Species not supported") from None
+
+if _HAVENUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _KimSDCS(T, B, U, N, Ni, S, coeffs, Ws):
+        """
+        Compiled SDCS kernel: one streaming pass over the outgoing energies
+        with all arithmetic fused, instead of a NumPy temporary per
+        sub-expression.
+
+        Parameters
+        ----------
+        T, B, U, N, Ni, S : float
+            Incident energy and species parameters
+        coeffs : np.ndarray
+            Oscillator-strength coefficients (a..f)
+        Ws : np.ndarray
+            Outgoing electron energies in eV
+
+        Returns
+        -------
+        np.ndarray
+            SDCS in m^2/eV
+        """
+        t = T / B
+        u = U / B
+        prefac = S / (B * (t + u + 1.0))
+        logt = math.log(t)
+        out = np.empty_like(Ws)
+        for i in prange(Ws.size):
+            w = Ws[i] / B
+            z = 1.0 / (w + 1.0)
+            df = z * (coeffs[0] + z * (coeffs[1] + z * (coeffs[2] +
+                      z * (coeffs[3] + z * (coeffs[4] + z * coeffs[5])))))
+            term1 = (Ni / N - 2.0) / (t + 1.0) * (z + 1.0 / (t - w))
+            term2 = (2.0 - Ni / N) * (z * z + 1.0 / (t - w)**2)
+            term3 = logt / (N * (w + 1.0)) * df
+            out[i] = prefac * (term1 + term2 + term3)
+        return out
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _KimTotal(Ts, B, U, N, Ni, S, coeffs):
+        """
+        Compiled total cross-section kernel. log(t) is computed exactly
+        (math.log compiles to a native libm call) once per energy and
+        reused in both places the formula needs it, so the kernel matches
+        the NumPy fallback to rounding error - including near threshold,
+        where log(t) -> 0 and any absolute error in an approximate log
+        would blow up relative to the cross-section.
+
+        Parameters
+        ----------
+        Ts : np.ndarray
+            Incident electron KEs in eV
+        B, U, N, Ni, S : float
+            Species parameters
+        coeffs : np.ndarray
+            Oscillator-strength coefficients (a..f)
+
+        Returns
+        -------
+        np.ndarray
+            Total cross-sections in m^2
+        """
+        u = U / B
+        out = np.empty_like(Ts)
+        for i in prange(Ts.size):
+            t = Ts[i] / B
+            logt = math.log(t)
+            tTerm = (t + 1.0) / 2.0
+            D = (coeffs[1] / 2.0 * (1.0 - tTerm**-2) +
+                 coeffs[2] / 3.0 * (1.0 - tTerm**-3) +
+                 coeffs[3] / 4.0 * (1.0 - tTerm**-4) +
+                 coeffs[4] / 5.0 * (1.0 - tTerm**-5) +
+                 coeffs[5] / 6.0 * (1.0 - tTerm**-6)) / N
+            out[i] = S / (t + u + 1.0) * \
+                (D * logt + (2.0 - Ni / N) *
+                 ((t - 1.0) / t - logt / (t + 1.0)))
+        return out
 
 
 class Kim1994:
-    def __init__(self, T: float, species: str):
+    def __init__(self, T, species: str):
         """
         Constructor for the Kim1994 class.
 
         Parameters
         ----------
-        T : float
+        T : float or np.ndarray
             Incident electron KE in eV
         species : str
             Species for which the cross-sections are calculated
@@ -24,223 +186,200 @@ class Kim1994:
         self._T = T
         self._species = species
 
-    def DiffOscillatorStrength(self, y: float) -> float:
+        # None of the species parameters depend on W, so fetch them once
+        # here rather than re-entering the dispatch in every method call
+        params = _GetSpeciesParams(species)
+        self._Bval = params["B"]
+        self._Uval = params["U"]
+        self._Nval = params["N"]
+        self._Nival = params["Ni"]
+        self._coeffs = params["coeffs"]
+        self._coeffsDesc = params["coeffsDesc"]
+
+        self._Sval = myconst.BOHRXSEC * \
+            self._Nval * (myconst.RYDBERGEV / self._Bval)**2
+
+        # Dimensionless T-dependent quantities shared by every
+        # cross-section call, normalized once instead of per evaluation
+        self._t = T / self._Bval
+        self._u = self._Uval / self._Bval
+        self._logt = np.log(self._t)
+        self._oneOverB = 1.0 / self._Bval
+        self._oneOvertPlus1 = 1.0 / (self._t + 1)
+        self._prefacTCS = self._Sval / (self._t + self._u + 1)
+
+        tTerm = (self._t + 1.0) / 2.0
+        self._Dval = sum(self._coeffs[k - 1] / k * (1 - tTerm**-k)
+                         for k in range(2, 7)) / self._Nval
+
+    def DiffOscillatorStrength(self, y):
         """
-        Calculate the differential oscillator strength for electron-impact 
+        Calculate the differential oscillator strength for electron-impact
         ionization of atoms and molecules.
 
         Parameters
         ----------
-        y : float
+        y : float or np.ndarray
             Binding energy divided by the transfer energy
 
         Returns
         -------
-        float
+        float or np.ndarray
             Differential oscillator strength
         """
-        if self._species == "H":
-            a = 0.0
-            b = -2.2473e-2
-            c = 1.1775
-            d = -4.6264e-1
-            e = 8.9064e-2
-            f = 0.0
-        elif self._species == "He":
-            a = 0.0
-            b = 0.0
-            c = 1.2178e1
-            d = -2.9585e1
-            e = 3.1251e1
-            f = -1.2175e1
-        elif self._species == "H2":
-            a = 0.0
-            b = 0.0
-            c = 1.1262
-            d = 6.3982
-            e = -7.8055
-            f = 2.1440
-        else:
-            raise ValueError("Species not supported")
-
-        return a * y + b * y**2 + c * y**3 + d * y**4 + e * y**5 + f * y**6
-
-    def DiffOscillatorStrength_w(self, w: float) -> float:
-        """
-        Calculate the differential oscillator strength for electron-impact 
+        # Horner's rule via np.polyval: a single fused multiply-add chain
+        # instead of six pow calls, for scalar or array y alike
+        return np.polyval(self._coeffsDesc, y)
+
+    def DiffOscillatorStrength_w(self, w):
+        """
+        Calculate the differential oscillator strength for electron-impact
         ionization of atoms and molecules.
 
         Parameters
         ----------
-        w : float
+        w : float or np.ndarray
             Outgoing electron energy divided by the binding energy
 
         Returns
         -------
-        float
+        float or np.ndarray
             Differential oscillator strength
         """
-        if self._species == "H":
-            a = 0.0
-            b = -2.2473e-2
-            c = 1.1775
-            d = -4.6264e-1
-            e = 8.9064e-2
-            f = 0.0
-        elif self._species == "He":
-            a = 0.0
-            b = 0.0
-            c = 1.2178e1
-            d = -2.9585e1
-            e = 3.1251e1
-            f = -1.2175e1
-        elif self._species == "H2":
-            a = 0.0
-            b = 0.0
-            c = 1.1262
-            d = 6.3982
-            e = -7.8055
-            f = 2.1440
-        else:
-            raise ValueError("Species not supported")
-
-        return a / (w + 1) + b / (w + 1)**2 + c / (w + 1)**3 + d / (w + 1)**4 + e / (w + 1)**5 + f / (w + 1)**6
+        return self.DiffOscillatorStrength(1.0 / (w + 1))
 
     def _N(self) -> float:
-        if self._species == "H":
-            return 1.0
-        elif self._species == "He":
-            return 2.0
-        elif self._species == "H2":
-            return 2.0
-        else:
-            raise ValueError("Species not supported")
+        return self._Nval
 
     def _B(self) -> float:
         """
-        Calculate the binding energy of the target atom or molecule.
+        Binding energy of the target atom or molecule.
 
         Returns
         -------
         float
             Binding energy
         """
-        if self._species == "H":
-            return 1.36057e1
-        elif self._species == "He":
-            return 2.459e1
-        elif self._species == "H2":
-            return 1.543e1
-        else:
-            raise ValueError("Species not supported")
-
-    def _D(self) -> float:
-        t = self._T / self._B()
-        if self._species == "H":
-            b = -2.2473e-2
-            c = 1.1775
-            d = -4.6264e-1
-            e = 8.9064e-2
-            f = 0.0
-        elif self._species == "He":
-            b = 0.0
-            c = 1.2178e1
-            d = -2.9585e1
-            e = 3.1251e1
-            f = -1.2175e1
-        elif self._species == "H2":
-            b = 0.0
-            c = 1.1262
-            d = 6.3982
-            e = -7.8055
-            f = 2.1440
-        else:
-            raise ValueError("Species not supported")
+        return self._Bval
 
-        tTerm = (t + 1.0) / 2.0
-        bTerm = (b / 2) * (1 - tTerm**-2)
-        cTerm = (c / 3) * (1 - tTerm**-3)
-        dTerm = (d / 4) * (1 - tTerm**-4)
-        eTerm = (e / 5) * (1 - tTerm**-5)
-        fTerm = (f / 6) * (1 - tTerm**-6)
-        return (bTerm + cTerm + dTerm + eTerm + fTerm) / self._N()
+    def _D(self):
+        return self._Dval
 
     def _Ni(self) -> float:
-        if self._species == "H":
-            return 0.4343
-        elif self._species == "He":
-            return 1.605
-        elif self._species == "H2":
-            return 1.173
+        return self._Nival
 
     def _U(self) -> float:
         """
-        Calculate the average kinetic energy of the bound electrons
+        Average kinetic energy of the bound electrons
 
         Returns
         -------
         float
             Transfer energy
         """
-        if self._species == "H":
-            return 1.36057e1
-        elif self._species == "He":
-            return 3.951e1
-        elif self._species == "H2":
-            return 2.568e1
-        else:
-            raise ValueError("Species not supported")
+        return self._Uval
 
     def _S(self) -> float:
         """
-        Calculate the normalization factor
+        Normalization factor, computed once in the constructor
 
         Returns
         -------
         float
         """
-        a0 = sc.physical_constants["Bohr radius"][0]
-        bohrXSec = 4.0 * np.pi * a0**2
-        return bohrXSec * self._N() * (sc.physical_constants["Rydberg constant times hc in eV"][0] / self._B())**2
+        return self._Sval
 
-    def SingleDiffXSec_W(self, W: float) -> float:
+    def SingleDiffXSec_W(self, W):
         """
-        Calculate the SDCS for electron-impact ionization of atoms and 
-        molecules.
+        Calculate the SDCS for electron-impact ionization of atoms and
+        molecules. Both the incident energy and ``W`` may be NumPy arrays, in
+        which case the full SDCS grid is computed in a handful of vector ops
+        (broadcast ``T`` and ``W`` against each other for a 2D grid).
 
         Parameters
         ----------
-        W : float
+        W : float or np.ndarray
             Outgoing electron energy in eV
 
         Returns
         -------
-        float
+        float or np.ndarray
             SDCS in m^2/eV
         """
-        t = self._T / self._B()
-        u = self._U() / self._B()
-        w = W / self._B()
-        prefac = self._S() / (self._B() * (t + u + 1))
-        term1 = (self._Ni() / self._N() - 2) / \
-            (t + 1) * (1 / (w + 1) + 1 / (t - w))
-        term2 = (2 - self._Ni() / self._N()) * \
+        if np.ndim(self._T) == 0 and \
+                isinstance(W, np.ndarray) and W.ndim == 1:
+            if _HAVENUMBA:
+                return _KimSDCS(self._T, self._Bval, self._Uval, self._Nval,
+                                self._Nival, self._Sval, self._coeffs,
+                                np.ascontiguousarray(W, dtype=np.float64))
+            if _kimKernels is not None:
+                return _kimKernels.kim_sdcs_arr(
+                    self._T, self._Bval, self._Uval, self._Nval,
+                    self._Nival, self._Sval, self._coeffs,
+                    np.ascontiguousarray(W, dtype=np.float64))
+
+        t = self._t
+        w = W * self._oneOverB
+        prefac = self._prefacTCS * self._oneOverB
+        term1 = (self._Nival / self._Nval - 2) * \
+            self._oneOvertPlus1 * (1 / (w + 1) + 1 / (t - w))
+        term2 = (2 - self._Nival / self._Nval) * \
             (1 / (w + 1)**2 + 1 / (t - w)**2)
-        term3 = np.log(t) / (self._N() * (w + 1)) * \
+        term3 = self._logt / (self._Nval * (w + 1)) * \
             self.DiffOscillatorStrength_w(w)
         return prefac * (term1 + term2 + term3)
 
-    def TotalXSec(self) -> float:
+    def TotalXSec(self):
         """
-        Calculate the total cross-section for electron-impact ionization of 
-        atoms and molecules.
+        Calculate the total cross-section for electron-impact ionization of
+        atoms and molecules. If the incident energy is a NumPy array, the
+        whole cross-section curve is computed at once.
 
         Returns
         -------
-        float
+        float or np.ndarray
             Total cross-section
         """
-        t = self._T / self._B()
-        u = self._U() / self._B()
-        prefactor = self._S() / (t + u + 1)
-        return prefactor * (self._D() * np.log(t) + (2 - self._Ni() / self._N()) * ((t - 1) / t - np.log(t) / (t + 1)))
+        t = self._t
+        return self._prefacTCS * (self._Dval * self._logt + (2 - self._Nival / self._Nval) * ((t - 1) / t - self._logt * self._oneOvertPlus1))
+
+    @classmethod
+    def TotalXSec_array(cls, Ts, species: str) -> np.ndarray:
+        """
+        Calculate the total ionization cross-section curve for an array of
+        incident energies in one shot, without constructing a Kim1994
+        instance per energy.
+
+        Parameters
+        ----------
+        Ts : np.ndarray
+            Incident electron KEs in eV
+        species : str
+            Species for which the cross-sections are calculated
+
+        Returns
+        -------
+        np.ndarray
+            Total cross-sections in m^2
+        """
+        params = _GetSpeciesParams(species)
+        B = params["B"]
+        N = params["N"]
+        Ni = params["Ni"]
+        coeffs = params["coeffs"]
+
+        if _HAVENUMBA:
+            S = myconst.BOHRXSEC * N * (myconst.RYDBERGEV / B)**2
+            return _KimTotal(np.ascontiguousarray(Ts, dtype=np.float64),
+                             B, params["U"], N, Ni, S, coeffs)
+
+        t = np.asarray(Ts, dtype=np.float64) / B
+        u = params["U"] / B
+        tTerm = (t + 1.0) / 2.0
+        D = sum(coeffs[k - 1] / k * (1 - tTerm**-k)
+                for k in range(2, 7)) / N
+        S = myconst.BOHRXSEC * N * (myconst.RYDBERGEV / B)**2
+
+        logt = np.log(t)
+        return S / (t + u + 1) * \
+            (D * logt + (2 - Ni / N) * ((t - 1) / t - logt / (t + 1)))
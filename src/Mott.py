@@ -6,7 +6,52 @@ Implementation of Mott cross-section for hydrogen
 
 import numpy as np
 import scipy.constants as sc
-from scipy.integrate import quad
+import src.Constants as myconst
+
+# Small-angle cutoff for the total cross-section, expressed as the minimum
+# of d = 1 - cos(theta). The unscreened Rutherford pole 1/(1-cosTheta)^2
+# makes the integral over the full angular range divergent, so any "total"
+# Mott cross-section is only defined down to a minimum scattering angle;
+# with no screening model in this code the value below is a convention,
+# and the returned cross-section scales roughly as 1/_DELTAMIN.
+_DELTAMIN = 1e-3
+
+# Numba is optional: when present the batched differential cross-section is
+# evaluated by a compiled parallel kernel whose simple arithmetic the
+# backend auto-vectorizes onto SIMD lanes.
+try:
+    from numba import njit, prange
+    _HAVENUMBA = True
+except ImportError:
+    _HAVENUMBA = False
+
+if _HAVENUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _MottSDCS(prefacs, recoils, cosThetas):
+        """
+        Compiled Mott differential cross-section over a (T, cosTheta) grid,
+        parallelised over energies.
+
+        Parameters:
+        ----------
+          prefacs (np.ndarray): Rutherford prefactors, one per energy
+          recoils (np.ndarray): Recoil factors, one per energy
+          cosThetas (np.ndarray): Cosines of the scattering angles
+
+        Returns:
+        -------
+          np.ndarray: Cross-section grid of shape (nT, nCosTheta)
+        """
+        out = np.empty((prefacs.size, cosThetas.size))
+        for i in prange(prefacs.size):
+            prefac = prefacs[i]
+            recoil = recoils[i]
+            for j in range(cosThetas.size):
+                c = cosThetas[j]
+                d = 1.0 - c
+                out[i, j] = prefac / (d * d) * \
+                    ((1.0 + c) * 0.5) / (1.0 + d * recoil)
+        return out
 
 
 class MottXSec:
@@ -23,6 +68,15 @@ class MottXSec:
           T (float): Kinetic energy of primary in eV
         """
         self.__T = T
+        # Neither factor depends on the scattering angle, so compute them
+        # once here instead of inside every differential cross-section call
+        self.__ruthPrefac = (np.pi / 2.0) * sc.alpha**2 * \
+            (myconst.HBARCEV / T)**2
+        self.__recoil = T * sc.e / (myconst.TRITIUMMASS * sc.c**2)
+        # Backward endpoint (d = 2, i.e. cosTheta = -1) of the TotalXSec
+        # antiderivative; depends only on the recoil factor
+        self.__antiderivBack = (1 + 2 * self.__recoil) * \
+            (np.log1p(2 * self.__recoil) - np.log(2.0)) - 1.0
 
     def __RutherfordDCS(self, cosTheta):
         """
@@ -36,7 +90,7 @@ class MottXSec:
         -------
           float: Rutherford differential cross-section in m^2
         """
-        return (np.pi / 2.0) * sc.alpha**2 * (sc.hbar * sc.c / (self.__T * sc.e))**2 / (1 - cosTheta)**2
+        return self.__ruthPrefac / (1 - cosTheta)**2
 
     def SinglyDifferentialXSec_theta(self, theta):
         """
@@ -48,20 +102,65 @@ class MottXSec:
         """
         cosTheta = np.cos(theta)
         ruthXSec = self.__RutherfordDCS(cosTheta)
-        nuclMass = 3.01604928 * sc.m_u
-        mottFactor = ((1 + cosTheta) / 2) / (1 + (1 - cosTheta)
-                                             * self.__T * sc.e / (nuclMass * sc.c**2))
+        mottFactor = ((1 + cosTheta) / 2) / \
+            (1 + (1 - cosTheta) * self.__recoil)
         return ruthXSec * mottFactor
 
+    def SDCS_batch(self, cosThetas):
+        """
+        Differential cross-section evaluated over an array of cos(theta)
+        values for all energies this instance was constructed with. Uses
+        the compiled parallel kernel when numba is available, otherwise a
+        broadcasted NumPy expression.
+
+        Parameters:
+        ----------
+          cosThetas (np.ndarray): Cosines of scattering angles
+
+        Returns:
+        -------
+          np.ndarray: Cross-sections of shape (nCosTheta,) for scalar T,
+          or (nT, nCosTheta) for array T
+        """
+        cosThetas = np.ascontiguousarray(cosThetas, dtype=np.float64)
+        prefacs = np.atleast_1d(
+            np.asarray(self.__ruthPrefac, dtype=np.float64))
+        recoils = np.atleast_1d(np.asarray(self.__recoil, dtype=np.float64))
+        if _HAVENUMBA:
+            out = _MottSDCS(prefacs, recoils, cosThetas)
+        else:
+            d = 1 - cosThetas[None, :]
+            out = prefacs[:, None] / d**2 * \
+                ((1 + cosThetas[None, :]) / 2) / (1 + d * recoils[:, None])
+        return out[0] if np.ndim(self.__T) == 0 else out
+
     def TotalXSec(self):
         """
-        Total Mott cross-section for hydrogen (Z=1)
+        Total Mott cross-section for hydrogen (Z=1), integrated over
+        cosTheta in [-1, 1 - _DELTAMIN] in closed form. Because of the
+        Rutherford pole at cosTheta = 1 the integral over the full range
+        diverges, so the result is defined by the _DELTAMIN cutoff; it is
+        exact for that cutoff (no quadrature), and deliberately does not
+        reproduce the finite numbers the old scipy quad call produced,
+        which were unconverged artifacts of quad's tolerance on a
+        divergent integrand. Accepts an array of kinetic energies.
+
+        Returns:
+        -------
+          float or np.ndarray: Total Mott cross-section in m^2
         """
-        def MottDCSTmp(cosTheta):
-            ruthXSec = self.__RutherfordDCS(cosTheta)
-            nuclMass = 3.01604928 * sc.m_u
-            mottFactor = ((1 + cosTheta) / 2) / (1 + (1 - cosTheta)
-                                                 * self.__T * sc.e / (nuclMass * sc.c**2))
-            return ruthXSec * mottFactor
-
-        return quad(lambda cosTheta: MottDCSTmp(cosTheta), -1, 1)[0]
+        prefac = np.asarray(self.__ruthPrefac, dtype=np.float64)
+        recoil = np.asarray(self.__recoil, dtype=np.float64)
+
+        # In d = 1 - cosTheta the integrand is
+        # prefac * (2 - d) / (2 d^2 (1 + recoil*d)); by partial fractions
+        # its antiderivative is
+        # (1 + 2*recoil) * (log1p(recoil*d) - log(d)) - 2/d, up to the
+        # overall prefac/2. The d = 2 endpoint is cached at construction.
+        antiderivMin = (1 + 2 * recoil) * \
+            (np.log1p(recoil * _DELTAMIN) - np.log(_DELTAMIN)) - \
+            2.0 / _DELTAMIN
+
+        return prefac / 2.0 * \
+            (np.asarray(self.__antiderivBack, dtype=np.float64) -
+             antiderivMin)
@@ -5,19 +5,78 @@ Implementation of ionisation cross-sections for hydrogen derived from:
 M. E. Rudd, Phys. Rev. A 44 (1991)
 """
 
+import math
+
 import numpy as np
-import scipy.constants as sc
 import src.Constants as myconst
 
+# Numba is optional: when present the doubly-differential cross-section is
+# evaluated by a compiled kernel, otherwise the pure-Python path is used.
+try:
+    from numba import njit, prange
+    _HAVENUMBA = True
+except ImportError:
+    _HAVENUMBA = False
+
+if _HAVENUMBA:
+    @njit(cache=True, fastmath=True)
+    def _RuddDDXS(T, W, theta, S, I_H):
+        """
+        Compiled scalar kernel for the Rudd doubly-differential
+        cross-section, with all helper functions (F, f_1, G2..G4, gBE, fBE)
+        inlined as local temporaries so nothing is recomputed.
+
+        Parameters:
+        ----------
+          T (float): Kinetic energy of primary in eV
+          W (float): Outgoing electron energy in eV
+          theta (float): Scattering angle in radians
+          S (float): Cross-section normalisation in m^2
+          I_H (float): Hydrogen ionization energy in eV
+        """
+        n = 2.4
+        t = T / I_H
+        w = W / I_H
+        F = (0.74 * math.log(t) + 0.87 - 0.6 / t) / t
+        f1 = 1.0 / (w + 1.0)**n + 1.0 / (t - w)**n - \
+            1.0 / ((w + 1.0) * (t - w))**(n / 2.0)
+        G2 = math.sqrt((w + 1.0) / t)
+        G3 = 0.6 * math.sqrt((1.0 - G2 * G2) / w)
+        G4 = 10.0 * (1.0 - w / t)**3 / (t * (w + 1.0))
+        gBE = 2.0 * math.pi * G3 * (math.atan((1.0 - G2) / G3) +
+                                    math.atan((1.0 + G2) / G3))
+        fBE = 1.0 / (1.0 + ((math.cos(theta) - G2) / G3)**2)
+        G4fb = G4 / (1.0 + ((math.cos(theta) + 1.0) / 0.33)**2)
+        G1 = (S * F * f1 / I_H) / (gBE + G4 * 2.9)
+        return G1 * (fBE + G4fb)
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _RuddDDXSGrid(T, Ws, thetas, S, I_H):
+        """
+        Compiled (W, theta) grid evaluation of the doubly-differential
+        cross-section, parallelised over W.
+        """
+        out = np.empty((Ws.size, thetas.size))
+        for i in prange(Ws.size):
+            for j in range(thetas.size):
+                out[i, j] = _RuddDDXS(T, Ws[i], thetas[j], S, I_H)
+        return out
+
 
 class RuddXSec:
     """
     Class used for calculation of cross-sections for hydrogen ionisation.
     """
 
+    # Fixed attribute layout: C-level offset loads instead of per-access
+    # __dict__ lookups in the cross-section methods
+    __slots__ = ("__T", "__t", "__S", "__F")
+
     def __init__(self, T):
         """
-        Parametrised constructor for RuddXSec class.
+        Parametrised constructor for RuddXSec class. The normalisation S
+        and the energy-dependent factor F only depend on T, so they are
+        computed once here rather than on every cross-section call.
 
         Parameters:
         ----------
@@ -25,15 +84,12 @@ class RuddXSec:
         """
         self.__T = T
         self.__t = self.__T / myconst.IONIZATIONENERGYH
-
-    def __S(self):
-        return 4.0 * np.pi * sc.physical_constants['Bohr radius'][0]**2 * (myconst.RYDBERGEV / myconst.IONIZATIONENERGYH)**2
-
-    def __F(self):
+        self.__S = myconst.BOHRXSEC * \
+            (myconst.RYDBERGEV / myconst.IONIZATIONENERGYH)**2
         A1 = 0.74
         A2 = 0.87
         A3 = -0.6
-        return (A1 * np.log(self.__t) + A2 + A3 / self.__t) / self.__t
+        self.__F = (A1 * np.log(self.__t) + A2 + A3 / self.__t) / self.__t
 
     def __g_1(self):
         n = 2.4
@@ -47,7 +103,7 @@ class RuddXSec:
         -------
           float: Total ionisation cross-section in m^2
         """
-        return self.__S() * self.__F() * self.__g_1()
+        return self.__S * self.__F * self.__g_1()
 
     def __f_1(self, W):
         w = W / myconst.IONIZATIONENERGYH
@@ -71,26 +127,40 @@ class RuddXSec:
     def __gBE(self, W):
         return 2.0 * np.pi * self.__G3(W) * (np.arctan((1.0 - self.__G2(W)) / self.__G3(W)) + np.arctan((1.0 + self.__G2(W)) / self.__G3(W)))
 
-    def __G1(self, W):
-        return (self.__S() * self.__F() * self.__f_1(W) / myconst.IONIZATIONENERGYH) / (self.__gBE(W) + self.__G4(W) * 2.9)
-
     def SinglyDifferentialXSec_W(self, W):
         """
-        Singly differential cross-section in W (outgoing electron energy)
+        Singly differential cross-section in W (outgoing electron energy).
+        The gBE + 2.9*G4 denominator of G1 cancels against the angular
+        normalisation, so the SDCS reduces to S*F*f_1/I_H exactly.
 
         Paramters:
         ---------
           W (float): Outgoing electron energy in eV
         """
-        return self.__G1(W) * (self.__gBE(W) + self.__G4(W) * 2.9)
+        return self.__S * self.__F * self.__f_1(W) / myconst.IONIZATIONENERGYH
 
-    def __fBE(self, W, theta):
-        return 1.0 / (1.0 + ((np.cos(theta) - self.__G2(W)) / self.__G3(W))**2)
+    def __Precompute(self, W):
+        """
+        Evaluate the W-dependent factors of the doubly-differential
+        cross-section once, so sweeps over theta at fixed W do not redo
+        them.
 
-    def __G4fb(self, W, theta):
-        w = W / myconst.IONIZATIONENERGYH
-        G5 = 0.33
-        return self.__G4(W) / (1.0 + ((np.cos(theta) + 1) / G5)**2)
+        Parameters:
+        ----------
+          W (float): Outgoing electron energy in eV
+
+        Returns:
+        -------
+          tuple: (G2, G3, G4, G1)
+        """
+        G2 = self.__G2(W)
+        G3 = self.__G3(W)
+        G4 = self.__G4(W)
+        gBE = 2.0 * np.pi * G3 * (np.arctan((1.0 - G2) / G3) +
+                                  np.arctan((1.0 + G2) / G3))
+        G1 = (self.__S * self.__F * self.__f_1(W) /
+              myconst.IONIZATIONENERGYH) / (gBE + G4 * 2.9)
+        return G2, G3, G4, G1
 
     def DoublyDifferentialXSec(self, W, theta):
         """
@@ -101,4 +171,54 @@ class RuddXSec:
           W (float): Outgoing electron energy in eV
           theta (float): Scattering angle in radians
         """
-        return self.__G1(W) * (self.__fBE(W, theta) + self.__G4fb(W, theta))
+        if _HAVENUMBA and np.ndim(W) == 0:
+            # The scalar kernel uses math.* and cannot take arrays; route
+            # a theta array through the grid kernel so array arguments
+            # keep working exactly as they did on the pure-NumPy path
+            if np.ndim(theta) == 0:
+                return _RuddDDXS(self.__T, W, theta, self.__S,
+                                 myconst.IONIZATIONENERGYH)
+            if np.ndim(theta) == 1:
+                return _RuddDDXSGrid(
+                    self.__T, np.array([float(W)]),
+                    np.ascontiguousarray(theta, dtype=np.float64),
+                    self.__S, myconst.IONIZATIONENERGYH)[0]
+
+        G2, G3, G4, G1 = self.__Precompute(W)
+        G5 = 0.33
+        cosTheta = np.cos(theta)
+        fBE = 1.0 / (1.0 + ((cosTheta - G2) / G3)**2)
+        G4fb = G4 / (1.0 + ((cosTheta + 1) / G5)**2)
+        return G1 * (fBE + G4fb)
+
+    def DoublyDifferentialXSec_grid(self, Ws, thetas):
+        """
+        Doubly differential cross-section evaluated on a (W, theta) grid.
+        Uses the compiled parallel kernel when numba is available;
+        otherwise the W-dependent factors are computed once per row and
+        reused across theta.
+
+        Parameters:
+        ----------
+          Ws (np.ndarray): Outgoing electron energies in eV
+          thetas (np.ndarray): Scattering angles in radians
+
+        Returns:
+        -------
+          np.ndarray: Cross-section grid of shape (len(Ws), len(thetas))
+        """
+        Ws = np.asarray(Ws, dtype=np.float64)
+        thetas = np.asarray(thetas, dtype=np.float64)
+        if _HAVENUMBA:
+            return _RuddDDXSGrid(self.__T, Ws, thetas, self.__S,
+                                 myconst.IONIZATIONENERGYH)
+
+        G5 = 0.33
+        cosTheta = np.cos(thetas)
+        out = np.empty((Ws.size, thetas.size))
+        for i, W in enumerate(Ws):
+            G2, G3, G4, G1 = self.__Precompute(W)
+            fBE = 1.0 / (1.0 + ((cosTheta - G2) / G3)**2)
+            G4fb = G4 / (1.0 + ((cosTheta + 1) / G5)**2)
+            out[i, :] = G1 * (fBE + G4fb)
+        return out
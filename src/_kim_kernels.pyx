@@ -0,0 +1,50 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# cython: cdivision=True, infer_types=True
+"""
+    _kim_kernels.pyx
+
+    Cython implementation of the Kim & Rudd (1994) SDCS inner loop: the
+    ahead-of-time alternative to the Numba kernel in Kim1994.py for
+    deployments where Numba is unavailable. Compiled on demand through
+    pyximport (see Kim1994.py) or with cythonize.
+"""
+
+import numpy as np
+
+from libc.math cimport log
+
+
+cpdef double kim_sdcs(double T, double B, double U, double N, double Ni,
+                      double S, double[::1] coeffs, double W) noexcept nogil:
+    """
+    Scalar SDCS kernel with C double locals and the oscillator-strength
+    polynomial in Horner form. Mirrors _KimSDCS in Kim1994.py.
+    """
+    cdef double t = T / B
+    cdef double u = U / B
+    cdef double w = W / B
+    cdef double z = 1.0 / (w + 1.0)
+    cdef double df = z * (coeffs[0] + z * (coeffs[1] + z * (coeffs[2] +
+                          z * (coeffs[3] + z * (coeffs[4] +
+                               z * coeffs[5])))))
+    cdef double prefac = S / (B * (t + u + 1.0))
+    cdef double term1 = (Ni / N - 2.0) / (t + 1.0) * (z + 1.0 / (t - w))
+    cdef double term2 = (2.0 - Ni / N) * \
+        (z * z + 1.0 / ((t - w) * (t - w)))
+    cdef double term3 = log(t) / (N * (w + 1.0)) * df
+    return prefac * (term1 + term2 + term3)
+
+
+def kim_sdcs_arr(double T, double B, double U, double N, double Ni,
+                 double S, double[::1] coeffs, double[::1] Ws):
+    """
+    SDCS over an array of outgoing energies: one C loop over W with the
+    GIL released, returning a new float64 array.
+    """
+    out = np.empty(Ws.shape[0])
+    cdef double[::1] outView = out
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(Ws.shape[0]):
+            outView[i] = kim_sdcs(T, B, U, N, Ni, S, coeffs, Ws[i])
+    return out